@@ -57,58 +57,56 @@ class ATMO_parameter:
         """
         #Set atmospheric parameters for the given lat/lon/cams_data
         #As per dynamic properties of object
+        See `project_batch`, parameters are set as scalar values
         :return:
         """
-        longitude = longitude if longitude > 0 else 360 + longitude
-
-        lon_array = self.ecmwf_data.longitude
-        lat_array = self.ecmwf_data.latitude
-
-        # Find in the lon_array / lat_array the index interval
-        # Including lon_ul and lat_ul
-        a_lon = np.where((lon_array < longitude))[0][-1]
-        if longitude > lon_array.max():
-            # lon is between 359.6 and 0 ...
-            b_lon = 0
-        else:
-            b_lon = np.where((lon_array >= longitude))[0][0]
-
-        a_lat = np.where((lat_array < latitude))[0][0]
-        b_lat = np.where((lat_array >= latitude))[0][-1]
-
-        # Compute geo extent around the point :
-        # => extent definition : LR,LL,UL,UR
-        extent = [lon_array[a_lon], lat_array[a_lat],
-                  lon_array[b_lon], lat_array[a_lat],
-                  lon_array[b_lon], lat_array[b_lat],
-                  lon_array[a_lon], lat_array[b_lat]]
+        self.project_batch([latitude], [longitude])
+        for key in self.ecmwf_data.mandatory_attributes:
+            setattr(self, key, getattr(self, key)[0])
+
+    def project_batch(self, latitudes, longitudes):
+        """
+        Set atmospheric parameters for several points at once: grid vertices of all points are searched
+        and atmospheric parameters are estimated with array operations, without a loop over points.
+        Atmospheric parameters are set as arrays, one value per point.
+        :param latitudes: points latitude (array like)
+        :param longitudes: points longitude (array like)
+        :return:
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        longitudes = np.where(longitudes > 0, longitudes, 360 + longitudes)
+
+        lon_array = np.asarray(self.ecmwf_data.longitude)
+        lat_array = np.asarray(self.ecmwf_data.latitude)
+
+        # Find in the lon_array / lat_array the index interval including each point,
+        # one row per point, first / last matching index retrieved with argmax
+        lon_lower = lon_array < longitudes[:, np.newaxis]
+        a_lon = lon_array.size - 1 - np.argmax(lon_lower[:, ::-1], axis=1)
+        # no match (lon is between 359.6 and 0 ...) gives 0 as expected
+        b_lon = np.argmax(~lon_lower, axis=1)
+
+        lat_lower = lat_array < latitudes[:, np.newaxis]
+        a_lat = np.argmax(lat_lower, axis=1)
+        b_lat = lat_array.size - 1 - np.argmax(~lat_lower[:, ::-1], axis=1)
 
         extent_index = [a_lon, a_lat,
                         b_lon, a_lat,
                         b_lon, b_lat,
                         a_lon, b_lat]
 
-        log.info(' - Selected vertex : ')
-        log.info('LL (px,ln) / (lon,lat) : (%s, %s) / (%s dd , %s dd)' % (
-            str(extent_index[0]), str(extent_index[1]), str(extent[0]), str(extent[1])))
-        log.info('LR (px,ln) / (lon,lat) : (%s, %s) / (%s dd , %s dd)' % (
-            str(extent_index[2]), str(extent_index[3]), str(extent[2]), str(extent[3])))
-        log.info('UR (px,ln) / (lon,lat) : (%s, %s) / (%s dd , %s dd)' % (
-            str(extent_index[4]), str(extent_index[5]), str(extent[4]), str(extent[5])))
-        log.info('UL (px,ln) / (lon,lat) : (%s, %s) / (%s dd , %s dd)' % (
-            str(extent_index[6]), str(extent_index[7]), str(extent[6]), str(extent[7])))
+        for index in range(latitudes.size):
+            log.info(' - Selected vertex (lon,lat) %s dd, %s dd: LL (%s, %s) LR (%s, %s) UR (%s, %s) UL (%s, %s)',
+                     longitudes[index], latitudes[index], *(value[index] for value in extent_index))
 
         # TIE Point grid defined - compute linear transformation
         # to estimate value at the lat/lon location
-        # origin : extent_ul[0], extent_ul[1]
-        delta_lon = 0.4  # extent[4] - extent[6]  # UR - UL
-        delta_lat = -0.4  # extent[1] - extent[7]  # LL - UL
-
-        lambda_lat = latitude - extent[7]
-        lambda_lon = longitude - extent[6]
+        delta_lon = 0.4
+        delta_lat = -0.4
 
-        beta_longitude = lambda_lon / delta_lon
-        beta_latitude = lambda_lat / delta_lat
+        beta_longitude = (longitudes - lon_array[a_lon]) / delta_lon
+        beta_latitude = (latitudes - lat_array[b_lat]) / delta_lat
 
         # Processing of all keys
         for key in self.ecmwf_data.mandatory_attributes:
@@ -146,8 +144,8 @@ class ATMO_parameter:
     def compute_model(cls, extent, v):
         """
         :param extent: The list of latitudes and longitudes
-        :param v:  The list of values
-        :return:  Linear transform parameters
+        :param v:  The list of values, or a (4, k) matrix to fit k parameters at once
+        :return:  Linear transform parameters, shape (3,) or (3, k)
 
         A.C = V with C = [c0 c1 c2]
         """
@@ -117,6 +117,8 @@ def smac_inv(r_toa, tetas, phis, tetav, phiv, pressure, taup550, uo3, uh2o, coef
     """
     r_surf=smac_inv( r_toa, tetas, phis, tetav, phiv,pressure,taup550, uo3, uh2o, coef)
     Corrections atmosphriques
+    r_toa can be a scalar or a numpy array, atmospheric terms are computed once
+    and only the final inversion is applied element wise
     """
     ah2o = coef.ah2o
     nh2o = coef.nh2o
@@ -20,6 +20,7 @@
 
 import logging
 import os
+import shutil
 
 import numpy as np
 from osgeo import gdal
@@ -48,9 +49,7 @@ def quicklook(product, images, bands, qlpath, quality=95, xRes=30, yRes=30, out_
             imagefiles.append(images[band])
 
     # create output directory if it does not exist
-    qldir = os.path.dirname(qlpath)
-    if not os.path.exists(qldir):
-        os.makedirs(qldir)
+    os.makedirs(os.path.dirname(qlpath), exist_ok=True)
 
     # Grayscale or RGB
     if len(bands) == 1:
@@ -58,17 +57,12 @@ def quicklook(product, images, bands, qlpath, quality=95, xRes=30, yRes=30, out_
     else:
         band_list = [1, 2, 3]
 
-    # create single vrt with B4 B3 B2
-    vrtpath = qlpath + '.vrt'
-
-    gdal.BuildVRT(vrtpath, imagefiles, separate=True)
-    log.debug("save in : %s", vrtpath)
+    # create single in memory vrt with B4 B3 B2, bands are stacked and read in one pass by Translate
+    vrt = gdal.BuildVRT('', imagefiles, separate=True)
 
     # Remove nodata attribut
-    vrt = gdal.Open(vrtpath, gdal.GA_Update)
     for i in band_list:
         vrt.GetRasterBand(i).DeleteNoDataValue()
-    del vrt
     # convert to JPEG (with scaling)
     # TODO: DN depend on the mission, the level of processing...
 
@@ -97,7 +91,7 @@ def quicklook(product, images, bands, qlpath, quality=95, xRes=30, yRes=30, out_
     else:
         create_options = [f'QUALITY={quality}'] if creationOptions is None else [f'QUALITY={quality}'] + creationOptions
 
-    dataset = gdal.Translate(qlpath, vrtpath, xRes=xRes, yRes=yRes, resampleAlg='bilinear', bandList=band_list,
+    dataset = gdal.Translate(qlpath, vrt, xRes=xRes, yRes=yRes, resampleAlg='bilinear', bandList=band_list,
                    outputType=gdal.GDT_Byte, format=out_format, creationOptions=create_options,
                    scaleParams=scale)
 
@@ -121,12 +115,55 @@ def quicklook(product, images, bands, qlpath, quality=95, xRes=30, yRes=30, out_
         log.warning(e, exc_info=True)
         log.warning('error updating the metadata of quicklook image')
 
-    # clean
-    os.remove(vrtpath)
+    vrt = None
 
     return qlpath
 
 
+def fast_copy(src: str, dst: str):
+    """Copy file content from src to dst (like `shutil.copyfile`, mode bits are not copied).
+    When available (Linux), `os.copy_file_range` is used so that the copy is done by the kernel,
+    and on copy-on-write file systems (btrfs, XFS) data blocks are shared instead of duplicated.
+    Fallback to `shutil.copyfile` otherwise (e.g. cross-device copy on old kernels).
+
+    Args:
+        src (str): source file path
+        dst (str): destination file path
+    """
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            copied = _copy_file_range(src_file, dst_file)
+        if copied:
+            return
+        log.debug("copy_file_range failed for %s, fallback to regular copy", src)
+
+    shutil.copyfile(src, dst)
+
+
+def _copy_file_range(src_file, dst_file) -> bool:
+    """Copy whole content of src_file in dst_file with `os.copy_file_range`
+
+    Args:
+        src_file: source file object opened in binary read mode
+        dst_file: destination file object opened in binary write mode
+
+    Returns:
+        bool: True if all content has been copied, False otherwise
+    """
+    remaining = os.fstat(src_file.fileno()).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+            if copied == 0:
+                # nothing copied before end of file, do not leave a truncated copy
+                return False
+            remaining -= copied
+    except OSError as error:
+        log.debug("copy_file_range error: %s", error)
+        return False
+    return True
+
+
 def out_stat(input_matrix, logger, label=""):
     logger.debug('Maximum %s : %s', label, np.max(input_matrix))
     logger.debug('Mean %s : %s', label, np.mean(input_matrix))
@@ -34,12 +34,18 @@ class S2L_ImageFile:
         'JPEG2000': 'jp2',
     }
 
-    def __init__(self, path, mode='r'):
+    def __init__(self, path, mode='r', dataset: gdal.Dataset = None):
+        """
+        :param path: image file path
+        :param mode: 'r' to read header from file, otherwise header is left empty
+        :param dataset: already opened dataset of path, if any, header and array are read from it
+                        instead of opening path again
+        """
         self.setFilePath(path)
 
         # geo information
         if mode == 'r':
-            self.readHeader()
+            self.readHeader(dataset)
         else:
             self.xSize = None
             self.ySize = None
@@ -53,6 +59,8 @@ class S2L_ImageFile:
 
         # really read only if array attribute is accessed (see array property)
         self._array = None
+        # dataset to read array from, released once array is read
+        self._dataset = dataset
 
     def setFilePath(self, path):
         # file name, path, dirname
@@ -71,9 +79,9 @@ class S2L_ImageFile:
             self.read()
         return self._array
 
-    def readHeader(self):
+    def readHeader(self, dataset: gdal.Dataset = None):
         # geo information
-        dst = gdal.Open(self.filepath)
+        dst = dataset if dataset is not None else gdal.Open(self.filepath)
         geo = dst.GetGeoTransform()
         self.xSize = dst.RasterXSize
         self.ySize = dst.RasterYSize
@@ -147,7 +155,8 @@ class S2L_ImageFile:
         return ul_x, ul_y, ur_x, ur_y, lr_x, lr_y, ll_x, ll_y
 
     def read(self):
-        dst = gdal.Open(self.filepath)
+        dst = self._dataset if self._dataset is not None else gdal.Open(self.filepath)
+        self._dataset = None
         band = dst.GetRasterBand(1)
         self._array = band.ReadAsArray()
         dst = None
@@ -211,6 +220,17 @@ class S2L_ImageFile:
 
         return new_image
 
+    def deflate_creation_options(self, DCmode=False) -> list:
+        """
+        GTiff creation options for DEFLATE compression, faster to encode/decode than LZW.
+        Predictor is chosen from the written data type: horizontal differencing (2) for integer,
+        floating point predictor (3) for float kept as is (DCmode), see `write`.
+        :param DCmode: same meaning as in `write`
+        :return: list of creation options
+        """
+        predictor = 3 if self.array.dtype.kind == 'f' and DCmode else 2
+        return ['COMPRESS=DEFLATE', f'PREDICTOR={predictor}', 'ZLEVEL=1', 'TILED=YES', 'NUM_THREADS=ALL_CPUS']
+
     def write(self, creation_options=None, DCmode=False, filepath=None, nodata_value=None, output_format: str = 'GTIFF',
               band: str = None, no_data_mask=None):
         """
@@ -237,10 +257,6 @@ class S2L_ImageFile:
         if not filepath.upper().endswith(self.FILE_EXTENSIONS[output_format]):
             filepath = os.path.splitext(filepath)[0] + "." + self.FILE_EXTENSIONS[output_format]
 
-        # check if directory to create
-        if not os.path.exists(self.dirpath):
-            os.makedirs(self.dirpath)
-
         # write with gdal
         e_type = gdal.GetDataTypeByName(self.array.dtype.name)
         if self.array.dtype.name.endswith('int8'):
@@ -254,8 +270,7 @@ class S2L_ImageFile:
         self.setFilePath(filepath)
 
         # Create folders hierarchy if needed:
-        if not os.path.exists(self.dirpath):
-            os.makedirs(self.dirpath)
+        os.makedirs(self.dirpath, exist_ok=True)
 
         if output_format == 'GTIFF':
             driver = gdal.GetDriverByName('GTiff')
@@ -276,7 +291,11 @@ class S2L_ImageFile:
             offset = float(S2L_config.config.get('offset'))
             gain = float(S2L_config.config.get('gain'))
 
-            array_out = (self.array.clip(min=0) * gain + offset).astype(np.uint16)
+            # scaling done in place in a single float buffer, then downcast once to UInt16
+            array_out = self.array.clip(min=0)
+            array_out *= gain
+            array_out += offset
+            array_out = array_out.astype(np.uint16)
 
             if no_data_mask is not None:
                 array_out[array_out == offset] += 1
@@ -158,8 +158,13 @@ def pixel_center(image: S2L_ImageFile, tile_code: str):
     return int(y), int(x)
 
 
-def _reproject(filepath: str, dir_out: str, ds_src: gdal.Dataset, x_res: int, y_res: int, target_srs: osr.SpatialReference, order: int) -> ReprojectResult:
-    """Reproject given dataset in the target srs in the given resolution
+def _reproject(filepath: str, dir_out: str, ds_src: gdal.Dataset, x_res: int, y_res: int, target_srs: osr.SpatialReference, order: int,
+               out_format: str = 'VRT') -> ReprojectResult:
+    """Reproject given dataset in the target srs in the given resolution.
+    By default, reprojection is written as a warped VRT: the reprojected raster is not encoded in a
+    temporary file to be read back just after, pixels are warped when the VRT is read.
+    Use 'GTiff' format when the reprojected raster is read several times (e.g. band by band),
+    as a warped VRT warps again the source for each read not served by GDAL cache.
 
     Args:
         filepath (str): path of the file to reproject, mainly used to build output file path and log
@@ -169,6 +174,7 @@ def _reproject(filepath: str, dir_out: str, ds_src: gdal.Dataset, x_res: int, y_
         y_res (int): target y resolution
         target_srs (osr.SpatialReference): target SRS
         order (int): resampling code, see `order_to_gdal_resampling` dict
+        out_format (str, optional): reprojected file gdal format, 'VRT' or 'GTiff'. Defaults to 'VRT'.
 
     Raises:
         error: if reprojection fail
@@ -181,13 +187,13 @@ def _reproject(filepath: str, dir_out: str, ds_src: gdal.Dataset, x_res: int, y_
     splitted_filename = os.path.splitext(os.path.basename(filepath))
     reprojected_filepath = os.path.join(
         dir_out,
-        f"{splitted_filename[0]}_REPROJ{splitted_filename[1]}"
+        f"{splitted_filename[0]}_REPROJ{'.vrt' if out_format == 'VRT' else splitted_filename[1]}"
     )
 
     log.info("Reproject %s to %s", filepath, reprojected_filepath)
 
     options = gdal.WarpOptions(
-        dstSRS=target_srs,
+        format=out_format, dstSRS=target_srs,
         targetAlignedPixels=False, cropToCutline=False, xRes=x_res, yRes=y_res, dstNodata=0,
         resampleAlg=order_to_gdal_resampling.get(order),
         warpOptions=['NUM_THREADS=ALL_CPUS'], multithread=True)
@@ -197,6 +203,8 @@ def _reproject(filepath: str, dir_out: str, ds_src: gdal.Dataset, x_res: int, y_
             reprojected_filepath,
             ds_src,
             options=options)
+        # write VRT XML (or GTiff) on disk, so that the file can also be opened by its path
+        reproj_ds.FlushCache()
 
         return ReprojectResult(reprojected_filepath, reproj_ds)
 
@@ -321,18 +329,17 @@ def reframe(
 
             log.info("Image epsg and target epsg differ: %s vs %s.", image_epsg, target_epsg)
 
+            # resolution is already known from image header, no need to read it again from the dataset
             ds_src = gdal.Open(image.filepath)
-            geo = ds_src.GetGeoTransform()
-            x_res = geo[1]
-            y_res = geo[5]
 
             result = _reproject(
                 image.filepath,
                 os.path.dirname(filepath_out),
                 ds_src,
-                x_res, y_res, target_srs, order
+                image.xRes, image.yRes, target_srs, order
             )
-            image = S2L_ImageFile(result.out_file_path)
+            # header and array from the reprojected dataset we already hold instead of opening its file again
+            image = S2L_ImageFile(result.out_file_path, dataset=result.dataset)
 
     # compute offsets (grid origin + dx/dy)
     xOff = (box.x_min - image.xMin + dx) / image.xRes
@@ -426,7 +433,8 @@ def reframe_multiband(filepath_in: str, tile_code: str, filepath_out: str, dx=0.
                 filepath_in,
                 os.path.dirname(filepath_in),
                 ds_src,
-                xRes, yRes, target_srs, order
+                xRes, yRes, target_srs, order,
+                out_format='GTiff'
             )
             ds_src = result.dataset
 
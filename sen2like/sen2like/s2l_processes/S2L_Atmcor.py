@@ -21,6 +21,8 @@
 import datetime as dt
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 
@@ -35,6 +37,16 @@ from s2l_processes.S2L_Process import S2L_Process
 
 log = logging.getLogger("Sen2Like")
 
+# TOA reflectance samples (0.0 to 1.0, step 0.01) used to fit the SMAC TOA -> surface relation
+_R_TOA = np.arange(101) / 100.
+# Vandermonde matrix of the order 2 fit on _R_TOA and its pseudo inverse, computed once.
+# Fit coefficients (highest degree first, as np.polyfit) are then _R_TOA_PINV @ r_surf
+_R_TOA_VANDER = np.vander(_R_TOA, 3)
+_R_TOA_PINV = np.linalg.pinv(_R_TOA_VANDER)
+# Max size in bytes of the float32 TOA image blocks on which SMAC is applied (whole rows), so that
+# input, output and no data mask of a block (about 2.25 times this size) stay close to L2 cache size
+_SMAC_BLOCK_BYTES = 256 * 1024
+
 
 def get_cams_configuration():
     return {
@@ -58,6 +70,43 @@ def get_smac_coefficients(product, band):
     return None
 
 
+def apply_smac_polynomial(bands_toa, poly_coefs, surf_ref):
+    """Apply the order 2 TOA to surface reflectance polynomial on an image block.
+    Evaluated in Horner form (c2 * x + c1) * x + c0 directly in the output to avoid temporaries,
+    non positive TOA pixels (no data) are set to 0 in the same pass over the block.
+    Output block can be the TOA block itself, then a block sized buffer is used for the evaluation.
+
+    Args:
+        bands_toa (NDArray): TOA reflectance block
+        poly_coefs (NDArray): polynomial coefficients, highest degree first
+        surf_ref (NDArray): float32 output block, same shape as bands_toa
+    """
+    in_place = np.shares_memory(bands_toa, surf_ref)
+    out = np.empty_like(surf_ref) if in_place else surf_ref
+    np.multiply(bands_toa, poly_coefs[0], out=out)
+    out += poly_coefs[1]
+    out *= bands_toa
+    out += poly_coefs[2]
+    np.copyto(out, 0, where=bands_toa <= 0)
+    if in_place:
+        surf_ref[...] = out
+
+
+@lru_cache(maxsize=128)
+def read_smac_coefficients(smac_file: str) -> smac.coeff:
+    """Read SMAC coefficient file.
+    Cached as the same files are used for every product of the same sensor.
+    Returned object MUST NOT be modified.
+
+    Args:
+        smac_file (str): SMAC coefficient file path
+
+    Returns:
+        smac.coeff: SMAC coefficients
+    """
+    return smac.coeff(smac_file)
+
+
 class S2L_Atmcor(S2L_Process):
     """
     Atmospheric Correction processing block class.
@@ -75,6 +124,9 @@ class S2L_Atmcor(S2L_Process):
         self.uO3 = 0.331  # Ozone content - unit: cm-atm , 0.3 cm-atm = 300 Dobson Units
         self.pressure = 1013.095  # Pressure - unit: hpa
         self.taup550 = 0.2  # taup550 - unit: unitless
+        # number of threads used to apply SMAC on image row blocks, dedicated param defaulting to 1
+        # as 'number_of_process' already sizes multi tile process pool and parallel band processing
+        self._number_of_threads = max(1, int(S2L_config.config.get('smac_number_of_threads', 1)))
 
     def smac_correction(self, product, array_in, band):
         """
@@ -107,8 +159,7 @@ class S2L_Atmcor(S2L_Process):
         phi_v = 0  # View Azimuth Angle Landsat (Nadir)
 
         # Atmospheric parameters retrieve from CAMS :
-        r_toa = np.arange(101) / 100.
-        r_surf_SMAC = np.zeros(101)
+        r_toa = _R_TOA
 
         # # Apply correction
 
@@ -119,27 +170,46 @@ class S2L_Atmcor(S2L_Process):
             log.error("No smac coefficients for %s", band)
             return array_in
 
-        smac_coefs = smac.coeff(coef_file)
+        smac_coefs = read_smac_coefficients(coef_file)
 
-        # Run SMAC for r_toa ranging from 0.0 to 1.0
-        for i in range(101):
-            r_surf_SMAC[i] = smac.smac_inv(
-                r_toa[i], theta_s, phi_s,
-                theta_v, phi_v, self.pressure,
-                self.taup550, self.uO3, self.uH2O, smac_coefs)
+        # Run SMAC for r_toa ranging from 0.0 to 1.0 (in one call, r_toa as array)
+        r_surf_SMAC = smac.smac_inv(
+            r_toa, theta_s, phi_s,
+            theta_v, phi_v, self.pressure,
+            self.taup550, self.uO3, self.uH2O, smac_coefs)
         #
         # Use a polynomial fit of order 2 to fit relation between surface reflectance and TOA reflectance
-        poly_coefs = np.polyfit(r_toa, r_surf_SMAC, 2, full=True)
-
-        # Read image band
-        Bands_toa = np.float32(array_in)
+        # least square solution with the precomputed pseudo inverse (same result as np.polyfit)
+        poly_coefs = _R_TOA_PINV @ r_surf_SMAC
+        residual = np.sum((_R_TOA_VANDER @ poly_coefs - r_surf_SMAC) ** 2)
+
+        # Read image band (no copy if already C-contiguous float32)
+        if not array_in.flags.c_contiguous:
+            log.debug('Non C-contiguous input array for band %s, a copy is done', band)
+        Bands_toa = np.ascontiguousarray(array_in, dtype=np.float32)
         #     # Apply fitted relation to convert TOA reflectance to surface reflectance
-        surf_ref = poly_coefs[0][2] + poly_coefs[0][1] * Bands_toa + poly_coefs[0][0] * Bands_toa ** 2
-        mask = (Bands_toa <= 0)
-        surf_ref[mask] = 0
+        # A copy of the input made above is only used here, so the result is written in it instead of
+        # allocating another raster. Otherwise a new raster is needed: the input must be left untouched,
+        # and the output cannot be shared between bands as it is kept by the output image.
+        if np.shares_memory(Bands_toa, array_in):
+            surf_ref = np.empty_like(Bands_toa)
+        else:
+            surf_ref = Bands_toa
+        # Row blocks, processed concurrently when several threads are set, numpy releases the GIL during arithmetic
+        block_rows = max(1, _SMAC_BLOCK_BYTES // max(1, Bands_toa.shape[1] * Bands_toa.itemsize))
+        step = max(1, min(block_rows, -(-Bands_toa.shape[0] // self._number_of_threads)))
+        blocks = [slice(start, start + step) for start in range(0, Bands_toa.shape[0], step)]
+        if self._number_of_threads == 1:
+            for block in blocks:
+                apply_smac_polynomial(Bands_toa[block], poly_coefs, surf_ref[block])
+        else:
+            with ThreadPoolExecutor(self._number_of_threads) as executor:
+                # consume results to raise exception if any
+                list(executor.map(
+                    lambda block: apply_smac_polynomial(Bands_toa[block], poly_coefs, surf_ref[block]), blocks))
 
         log.debug('2nd Polynomial Coefs / Residual for band %s: %f %f %f %f',
-            band, poly_coefs[0][2], poly_coefs[0][1], poly_coefs[0][0], poly_coefs[1][0])
+            band, poly_coefs[2], poly_coefs[1], poly_coefs[0], residual)
 
         return surf_ref
 
@@ -163,48 +233,31 @@ class S2L_Atmcor(S2L_Process):
 
         ecmwf_data = ECMWF_Product(cams_config=get_cams_configuration(), observation_datetime=obs_datetime)
         if ecmwf_data.is_valid:
-            # Process each corner in the scene and set atmospheric parameter with cams_data
-            v_ctwv = np.empty((4, 1))
-            v_gtc03 = np.empty((4, 1))
-            v_msl = np.empty((4, 1))
-            v_aot = np.empty((4, 1))
-
-            lon_sc = 0
-            lat_sc = 0
-            for index in range(4):
-                lon_sc = lon_sc + (extent[2 * index]) * 0.25
-                lat_sc = lat_sc + (extent[2 * index + 1]) * 0.25
-                lon = extent[2 * index]
-                lat = extent[2 * index + 1]
-                atmo = ATMO_parameter(ecmwf_data)
-                atmo.project(lat, lon)
-                v_ctwv[index] = atmo.getTotalColumnWaterVapor()
-                v_gtc03[index] = atmo.getTotalOzone()
-                v_msl[index] = atmo.getAirPressure()
-                v_aot[index] = atmo.aod550
+            # scene center, extent is (lon, lat) of the 4 corners
+            corners = np.asarray(extent, dtype=float)
+            lon_sc = corners[0::2].mean()
+            lat_sc = corners[1::2].mean()
+
+            # Set atmospheric parameter with cams_data for the 4 corners of the scene at once
+            atmo = ATMO_parameter(ecmwf_data)
+            atmo.project_batch(corners[1::2], corners[0::2])
+            # one row per corner, columns are water vapor, ozone, air pressure and aot
+            values = np.column_stack((
+                atmo.getTotalColumnWaterVapor(),
+                atmo.getTotalOzone(),
+                atmo.getAirPressure(),
+                atmo.aod550
+            ))
 
             # Least square adjustment to get atmo parameter at the scene center
-            # location (or any other points in the scene)
-            # Total Column Water Vapor
-            c1, c2, c3 = ATMO_parameter.compute_model(extent, v_ctwv)
-            estimate_ctwv = c1 * lon_sc + c2 * lat_sc + c3
-
-            # Total Ozone
-            c1, c2, c3 = ATMO_parameter.compute_model(extent, v_gtc03)
-            estimate_gtc03 = c1 * lon_sc + c2 * lat_sc + c3
-
-            # Air pressure
-            c1, c2, c3 = ATMO_parameter.compute_model(extent, v_msl)
-            estimate_msl = c1 * lon_sc + c2 * lat_sc + c3
+            # location (or any other points in the scene), solved once for all parameters
+            c1, c2, c3 = ATMO_parameter.compute_model(extent, values)
+            estimate_ctwv, estimate_gtc03, estimate_msl, estimate_aot = c1 * lon_sc + c2 * lat_sc + c3
 
-            # Total Column Water Vapor
-            c1, c2, c3 = ATMO_parameter.compute_model(extent, v_aot)
-            estimate_aot = c1 * lon_sc + c2 * lat_sc + c3
-
-            self.uH2O = estimate_ctwv[0]  # Water Vapor content - unit: g.cm-2
-            self.uO3 = estimate_gtc03[0]  # Ozone content - unit: unit: cm , 0.3 cm= 300 Dobson Units
-            self.pressure = estimate_msl[0]  # Pressure - unit: hpa
-            self.taup550 = estimate_aot[0]  # taup550 - unit: unitless
+            self.uH2O = estimate_ctwv  # Water Vapor content - unit: g.cm-2
+            self.uO3 = estimate_gtc03  # Ozone content - unit: unit: cm , 0.3 cm= 300 Dobson Units
+            self.pressure = estimate_msl  # Pressure - unit: hpa
+            self.taup550 = estimate_aot  # taup550 - unit: unitless
 
             log.info(" Results : ")
             log.info("Estimate Total colum water vapor: %s", estimate_ctwv)
@@ -220,8 +273,8 @@ class S2L_Atmcor(S2L_Process):
         array_out = self.smac_correction(product, array_in, band)
         out_image = image.duplicate(self.output_file(product, band), array_out)
         if self.generate_intermediate_products:
-            image.write(creation_options=['COMPRESS=LZW'])
-        
+            out_image.write(creation_options=out_image.deflate_creation_options())
+
         log.info('End')
 
         return out_image
@@ -20,9 +20,9 @@
 
 import logging
 import os
-import shutil
 
 from core.products.product import S2L_Product
+from core.S2L_tools import fast_copy
 from s2l_processes.S2L_Product_Packager import PackagerConfig, S2L_Product_Packager
 
 log = logging.getLogger("Sen2Like")
@@ -66,7 +66,7 @@ class S2L_PackagerL2F(S2L_Product_Packager):
         if product.fusion_auto_check_threshold_msk_file is not None:
             outfile = "_".join([product.metadata.mtd.get(self.mtd_band_root_name_field), 'FCM']) + '.TIF'
             fpath = os.path.join(qi_data_dir, outfile)
-            shutil.copyfile(product.fusion_auto_check_threshold_msk_file, fpath)
+            fast_copy(product.fusion_auto_check_threshold_msk_file, fpath)
             product.metadata.mtd.get(self.mtd_quicklook_field).append(fpath)
 
     def guard(self, product:S2L_Product):
@@ -20,7 +20,6 @@
 import datetime as dt
 import logging
 import os
-import shutil
 from dataclasses import dataclass
 from xml.etree import ElementTree
 
@@ -39,7 +38,7 @@ from core.QI_MTD.mtd_writers import (
 )
 from core.QI_MTD.QIreport import QiWriter
 from core.QI_MTD.stac_interface import STACWriter
-from core.S2L_tools import quicklook
+from core.S2L_tools import fast_copy, quicklook
 from s2l_processes.S2L_Process import S2L_Process
 
 log = logging.getLogger("Sen2Like")
@@ -85,6 +84,13 @@ class S2L_Product_Packager(S2L_Process):
         self.product_suffix = config.product_suffix
         self.mtd_product_qi_xsd_field = config.mtd_product_qi_xsd_field
         self.tile_mtd_file_path = config.tile_mtd_file_path
+        # product nodata mask, read once, and its resized versions by shape
+        self._nodata_mask = None
+        self._resized_nodata_masks = {}
+        # product output layout, set once in preprocess for all bands
+        self._ts_dir = None
+        self._band_root_name = None
+        self._output_format = None
 
     def base_path_product(self, product: S2L_Product):
         """
@@ -150,6 +156,9 @@ class S2L_Product_Packager(S2L_Process):
 
     def preprocess(self, product: S2L_Product):
 
+        self._nodata_mask = None
+        self._resized_nodata_masks = {}
+
         if not self.guard(product):
             log.info('Abort pre process due to execution condition')
             return
@@ -158,13 +167,20 @@ class S2L_Product_Packager(S2L_Process):
         # set it first as it is used in base_path_product
         metadata.mtd['product_creation_date'] = metadata.mtd.get('product_creation_date', dt.datetime.utcnow())
 
-        product_name, granule_compact_name, tile_code, _ = self.base_path_product(product)
+        product_name, granule_compact_name, tile_code, datatake_sensing_start = self.base_path_product(product)
 
         metadata.mtd[self.mtd_product_name_field] = product_name
         metadata.mtd[self.mtd_granule_name_field] = granule_compact_name
 
         out_dir = os.path.join(S2L_config.config.get('archive_dir'), tile_code)
 
+        # same for all bands, so computed once here and not in process
+        self._ts_dir = out_dir  # ts = temporal series
+        self._band_root_name = "_".join([self.product_type_name, 'T' + tile_code, datatake_sensing_start,
+                                         product.sensor_name, f'R{product.mtl.relative_orbit:0>3}'])
+        self._output_format = S2L_config.config.get('output_format')
+        metadata.mtd[self.mtd_band_root_name_field] = self._band_root_name
+
         # Creation of S2 folder tree structure
         # tree = core.QI_MTD.S2_structure.generate_S2_structure_XML(out_xml='', product_name=product_name,
         #                                                    tile_name=granule_compact_name, save_xml=False)
@@ -206,40 +222,30 @@ class S2L_Product_Packager(S2L_Process):
 
         # /data/HLS_DATA/Archive/Site_Name/TILE_ID/S2L_DATEACQ_DATEPROD_SENSOR/S2L_DATEACQ_DATEPROD_SENSOR
         res = image.xRes
-        product_name, granule_compact_name, tile_code, datatake_sensing_start = self.base_path_product(product)
-        sensor = product.sensor_name
-        relative_orbit = product.mtl.relative_orbit
+        product_name = product.metadata.mtd[self.mtd_product_name_field]
+        granule_compact_name = product.metadata.mtd[self.mtd_granule_name_field]
         native = band in product.native_bands
         s2_band = product.get_s2like_band(band)
 
         if not native:
             band = s2_band
 
-        band_root_name = "_".join([self.product_type_name, 'T' + tile_code,
-                                  datatake_sensing_start, sensor, f'R{relative_orbit:0>3}'])
-
-        product.metadata.mtd[self.mtd_band_root_name_field] = band_root_name
-
-        output_format = S2L_config.config.get('output_format')
-        outfile = "_".join([band_root_name, band, f'{int(res)}m']) + '.' + S2L_ImageFile.FILE_EXTENSIONS[
+        output_format = self._output_format
+        outfile = "_".join([self._band_root_name, band, f'{int(res)}m']) + '.' + S2L_ImageFile.FILE_EXTENSIONS[
             output_format]
         # Naming convention from Sentinel-2-Products-Specification-Document (p294)
 
-        ts_dir = os.path.join(S2L_config.config.get('archive_dir'), tile_code)  # ts = temporal series
-        new_path = self.band_path(ts_dir, product_name, granule_compact_name, outfile, native=native)
+        new_path = self.band_path(self._ts_dir, product_name, granule_compact_name, outfile, native=native)
 
         log.debug('New: %s',  new_path)
         creation_options = []
 
-        if output_format in ('COG', 'GTIFF'):
+        if output_format == 'GTIFF':
+            creation_options = image.deflate_creation_options()
+        elif output_format == 'COG':
             creation_options.append('COMPRESS=LZW')
 
-        nodata_mask = S2L_ImageFile(product.nodata_mask_filename).array
-
-        if nodata_mask.shape != image.array.shape:
-            nodata_mask = skit_resize(
-                nodata_mask.clip(min=-1.0, max=1.0), image.array.shape, order=0, preserve_range=True
-            ).astype(np.uint8)
+        nodata_mask = self._get_nodata_mask(product, image.array.shape)
 
         image.write(
             creation_options=creation_options,
@@ -258,6 +264,35 @@ class S2L_Product_Packager(S2L_Process):
         log.info('End process')
         return image
 
+    def _get_nodata_mask(self, product: S2L_Product, shape: tuple):
+        """
+        Get the product nodata mask at the given shape.
+        The mask file is read once per product and resized masks are kept in memory
+        for the other bands having the same shape.
+
+        Args:
+            product (S2L_Product): product to get the nodata mask of
+            shape (tuple): expected mask shape
+
+        Returns:
+            nodata mask array
+        """
+        nodata_mask = self._resized_nodata_masks.get(shape)
+        if nodata_mask is not None:
+            return nodata_mask
+
+        if self._nodata_mask is None:
+            self._nodata_mask = S2L_ImageFile(product.nodata_mask_filename).array
+
+        nodata_mask = self._nodata_mask
+        if nodata_mask.shape != shape:
+            nodata_mask = skit_resize(
+                nodata_mask.clip(min=-1.0, max=1.0), shape, order=0, preserve_range=True
+            ).astype(np.uint8)
+
+        self._resized_nodata_masks[shape] = nodata_mask
+        return nodata_mask
+
     def postprocess(self, product: S2L_Product):
         """
         Copy auxiliary files in the final output like mask, angle files
@@ -270,10 +305,11 @@ class S2L_Product_Packager(S2L_Process):
             log.info('Abort post process due to execution condition')
             return
 
-        # output directory
-        product_name, granule_compact_name, tile_code, datatake_sensing_start = self.base_path_product(product)
+        # output directory, as set in preprocess
+        product_name = product.metadata.mtd[self.mtd_product_name_field]
+        granule_compact_name = product.metadata.mtd[self.mtd_granule_name_field]
 
-        ts_dir = os.path.join(S2L_config.config.get('archive_dir'), tile_code)  # ts = temporal series
+        ts_dir = self._ts_dir  # ts = temporal series
         product_path = os.path.join(ts_dir, product_name)
         granule_dir = os.path.join(product_path, 'GRANULE', granule_compact_name)
         qi_data_dir = os.path.join(granule_dir, 'QI_DATA')
@@ -286,18 +322,17 @@ class S2L_Product_Packager(S2L_Process):
 
         # ROI File (ROI based mode)
         if product.roi_filename:
-            shutil.copyfile(product.roi_filename, os.path.join(qi_data_dir, os.path.basename(product.roi_filename)))
+            fast_copy(product.roi_filename, os.path.join(qi_data_dir, os.path.basename(product.roi_filename)))
 
         # QI directory
         qi_path = os.path.join(ts_dir, 'QI')
-        if not os.path.exists(qi_path):
-            os.makedirs(qi_path)
+        os.makedirs(qi_path, exist_ok=True)
 
         # save correl file in QI
         if os.path.exists(os.path.join(product.working_dir, 'correl_res.txt')):
             corr_name = f"{product_name}_CORREL.csv"
             corr_path = os.path.join(qi_path, corr_name)
-            shutil.copy(os.path.join(product.working_dir, 'correl_res.txt'), corr_path)
+            fast_copy(os.path.join(product.working_dir, 'correl_res.txt'), corr_path)
 
         self.postprocess_quicklooks(qi_data_dir, product)
 
@@ -329,28 +364,31 @@ class S2L_Product_Packager(S2L_Process):
             product (S2L_Product): product
         """
 
+        quality = S2L_config.config.get("quicklook_jpeg_quality", 95)
+        offset = int(S2L_config.config.get('offset'))
+
         # PVI : MUST BE FIRST
         band_list = ["B04", "B03", "B02"]
         pvi_filename = f"{product.metadata.mtd.get(self.mtd_band_root_name_field)}_PVI.TIF"
         ql_path = os.path.join(qi_data_dir, pvi_filename)
-        result_path = quicklook(product, self.images, band_list, ql_path, S2L_config.config.get(
-            "quicklook_jpeg_quality", 95),
-            xRes=320, yRes=320, creationOptions=['COMPRESS=LZW'],
-            out_format='GTIFF', offset=int(S2L_config.config.get('offset')))
+        result_path = quicklook(product, self.images, band_list, ql_path, quality,
+                                xRes=320, yRes=320, creationOptions=['COMPRESS=LZW'],
+                                out_format='GTIFF', offset=offset)
 
         if result_path is not None:
             product.metadata.mtd.get(self.mtd_quicklook_field).append(ql_path)
 
         if len(self.images.keys()) > 1:
             # true color QL
-            self.handle_product_quicklook(qi_data_dir, product, ["B04", "B03", "B02"], 'B432')
-            self.handle_product_quicklook(qi_data_dir, product, ["B12", "B11", "B8A"], 'B12118A')
+            self.handle_product_quicklook(qi_data_dir, product, ["B04", "B03", "B02"], 'B432', quality, offset)
+            self.handle_product_quicklook(qi_data_dir, product, ["B12", "B11", "B8A"], 'B12118A', quality, offset)
         else:
             # grayscale QL
             band_list = list(self.images.keys())
-            self.handle_product_quicklook(qi_data_dir, product, band_list, band_list[0])
+            self.handle_product_quicklook(qi_data_dir, product, band_list, band_list[0], quality, offset)
 
-    def handle_product_quicklook(self, qi_data_dir: str, product: S2L_Product, band_list: list, suffix: str):
+    def handle_product_quicklook(self, qi_data_dir: str, product: S2L_Product, band_list: list, suffix: str,
+                                 quality: int, offset: int):
         """
         Creates a quicklook for the given bands
         Args:
@@ -358,11 +396,12 @@ class S2L_Product_Packager(S2L_Process):
             product (S2L_Product): product
             band_list (list): list of band name of the product to use to generate the QL
             suffix (str): quicklook filename suffix (before extension)
+            quality (int): JPEG quality of the quicklook
+            offset (int): radiometric offset of the band images
         """
         ql_name = "_".join([product.metadata.mtd.get(self.mtd_band_root_name_field), 'QL', suffix]) + '.jpg'
         ql_path = os.path.join(qi_data_dir, ql_name)
-        result_path = quicklook(product, self.images, band_list, ql_path, S2L_config.config.get(
-            "quicklook_jpeg_quality", 95), offset=int(S2L_config.config.get('offset')))
+        result_path = quicklook(product, self.images, band_list, ql_path, quality, offset=offset)
 
         if result_path is not None:
             product.metadata.mtd.get(self.mtd_quicklook_field).append(ql_path)
@@ -382,7 +421,7 @@ class S2L_Product_Packager(S2L_Process):
             for element in mask_elements:
                 mask_file = os.path.join(product.path, element.text)
                 if os.path.exists(mask_file):
-                    shutil.copyfile(mask_file, os.path.join(qi_data_dir, os.path.basename(mask_file)))
+                    fast_copy(mask_file, os.path.join(qi_data_dir, os.path.basename(mask_file)))
                     product.metadata.mtd.get(self.mtd_mask_field).append({"tag": "MASK_FILENAME", "attribs": element.attrib,
                                                                   "text": element.text})
 
@@ -393,16 +432,16 @@ class S2L_Product_Packager(S2L_Process):
         product.metadata.mtd.get(self.mtd_mask_field).append({"tag": "MASK_FILENAME", "attribs": {"type": "MSK_VALPXL"},
                                                       "text": os.path.relpath(fpath, product_path)})
 
-        if S2L_config.config.get('output_format') == 'COG':
+        if self._output_format == 'COG':
             img_object = S2L_ImageFile(product.mask_filename, mode='r')
             img_object.write(filepath=fpath, output_format='COG', band='MASK')
         else:
-            shutil.copyfile(product.mask_filename, fpath)
+            fast_copy(product.mask_filename, fpath)
 
     def _copy_angles_file(self, product, qi_data_dir):
         outfile = f"{product.metadata.mtd.get(self.mtd_band_root_name_field)}_ANG.TIF"
         product.metadata.mtd['ang_filename'] = outfile
-        shutil.copyfile(product.angles_file, os.path.join(qi_data_dir, outfile))
+        fast_copy(product.angles_file, os.path.join(qi_data_dir, outfile))
 
     def _write_qi_report(self, product, qi_data_dir):
         bb_qi_path = product.metadata.hardcoded_values.get(self.mtd_bb_qi_path_field)
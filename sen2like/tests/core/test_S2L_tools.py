@@ -0,0 +1,48 @@
+"""S2L_tools module tests"""
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from core.S2L_tools import fast_copy
+
+
+class TestFastCopy(TestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp_dir.name, 'src.bin')
+        self.dst = os.path.join(self._tmp_dir.name, 'dst.bin')
+        self.content = os.urandom(3 * 1024 * 1024 + 17)
+        with open(self.src, 'wb') as src_file:
+            src_file.write(self.content)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _read_dst(self):
+        with open(self.dst, 'rb') as dst_file:
+            return dst_file.read()
+
+    def test_copy(self):
+        fast_copy(self.src, self.dst)
+        self.assertEqual(self._read_dst(), self.content)
+
+    def test_copy_empty_file(self):
+        open(self.src, 'wb').close()
+        fast_copy(self.src, self.dst)
+        self.assertEqual(self._read_dst(), b'')
+
+    def test_copy_fallback_on_error(self):
+        with mock.patch.object(os, 'copy_file_range', side_effect=OSError('not supported'), create=True):
+            fast_copy(self.src, self.dst)
+        self.assertEqual(self._read_dst(), self.content)
+
+    def test_copy_fallback_on_partial_copy(self):
+        # first call copies nothing before end of file
+        with mock.patch.object(os, 'copy_file_range', return_value=0, create=True):
+            fast_copy(self.src, self.dst)
+        self.assertEqual(self._read_dst(), self.content)
+
+    def test_missing_source(self):
+        with self.assertRaises(FileNotFoundError):
+            fast_copy(os.path.join(self._tmp_dir.name, 'missing.bin'), self.dst)
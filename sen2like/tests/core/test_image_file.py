@@ -0,0 +1,34 @@
+"""image_file module tests"""
+from unittest import TestCase
+
+import numpy as np
+
+from core.image_file import S2L_ImageFile
+
+
+def _image(dtype):
+    image = S2L_ImageFile('image.TIF', mode='w')
+    image._array = np.zeros((2, 2), dtype=dtype)
+    return image
+
+
+class TestS2L_ImageFile(TestCase):
+
+    def test_deflate_creation_options_integer(self):
+        options = _image(np.uint16).deflate_creation_options()
+        self.assertIn('COMPRESS=DEFLATE', options)
+        self.assertIn('PREDICTOR=2', options)
+        # DCmode does not change integer predictor
+        self.assertIn('PREDICTOR=2', _image(np.uint16).deflate_creation_options(DCmode=True))
+
+    def test_deflate_creation_options_float(self):
+        # float written as UInt16
+        options = _image(np.float32).deflate_creation_options()
+        self.assertIn('COMPRESS=DEFLATE', options)
+        self.assertIn('PREDICTOR=2', options)
+
+    def test_deflate_creation_options_float_dc_mode(self):
+        # float kept as is
+        options = _image(np.float32).deflate_creation_options(DCmode=True)
+        self.assertIn('COMPRESS=DEFLATE', options)
+        self.assertIn('PREDICTOR=3', options)
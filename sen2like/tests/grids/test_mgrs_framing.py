@@ -0,0 +1,61 @@
+"""mgrs_framing module tests"""
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from osgeo import gdal, osr
+
+from core.image_file import S2L_ImageFile
+from grids import mgrs_framing
+
+# 31TGJ tile is in UTM 31N (EPSG:32631), bounds in UTM 31N
+TILE_CODE = '31TGJ'
+TILE_BOUNDS = (699960, 4790220, 809760, 4900020)
+RES = 600
+
+
+def _create_image_in_utm_32(filepath):
+    """Create an image in UTM 32N (EPSG:32632) covering the 31TGJ tile, filled with 100"""
+    tile_srs = osr.SpatialReference()
+    tile_srs.ImportFromEPSG(32631)
+    image_srs = osr.SpatialReference()
+    image_srs.ImportFromEPSG(32632)
+    for srs in (tile_srs, image_srs):
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    transformation = osr.CoordinateTransformation(tile_srs, image_srs)
+
+    x_min, y_min, x_max, y_max = TILE_BOUNDS
+    corners = [transformation.TransformPoint(x, y)[:2] for x in (x_min, x_max) for y in (y_min, y_max)]
+    xs, ys = zip(*corners)
+    # margin to fully cover the tile once reprojected
+    x_origin = min(xs) - 10 * RES
+    y_origin = max(ys) + 10 * RES
+    x_size = int((max(xs) - min(xs)) / RES) + 20
+    y_size = int((max(ys) - min(ys)) / RES) + 20
+
+    dataset = gdal.GetDriverByName('GTiff').Create(filepath, x_size, y_size, 1, gdal.GDT_UInt16)
+    dataset.SetProjection(image_srs.ExportToWkt())
+    dataset.SetGeoTransform((x_origin, RES, 0, y_origin, 0, -RES))
+    dataset.GetRasterBand(1).WriteArray(np.full((y_size, x_size), 100, dtype=np.uint16))
+    dataset = None
+
+
+class TestMgrsFraming(TestCase):
+
+    def test_reframe_other_utm_zone(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, 'image_32632.TIF')
+            _create_image_in_utm_32(filepath)
+
+            image = mgrs_framing.reframe(
+                S2L_ImageFile(filepath), TILE_CODE, os.path.join(tmp_dir, 'image_REFRAMED.TIF'), order=0)
+
+            tile_size = int(np.ceil((TILE_BOUNDS[2] - TILE_BOUNDS[0]) / RES))
+            self.assertEqual(image.array.shape, (tile_size, tile_size))
+            self.assertEqual((image.xMin, image.yMax), (TILE_BOUNDS[0], TILE_BOUNDS[3]))
+            tile_srs = osr.SpatialReference()
+            tile_srs.ImportFromEPSG(32631)
+            self.assertTrue(tile_srs.IsSame(osr.SpatialReference(wkt=image.projection)))
+            # tile is fully covered by the reprojected image
+            np.testing.assert_array_equal(image.array[1:-1, 1:-1], 100)
@@ -0,0 +1,101 @@
+"""S2L_Atmcor module tests"""
+import os
+from types import SimpleNamespace
+from unittest import TestCase
+
+import numpy as np
+
+from atmcor.atmospheric_parameters import ATMO_parameter
+from atmcor.smac import smac
+from core.S2L_config import config
+from s2l_processes.S2L_Atmcor import S2L_Atmcor, get_smac_coefficients
+
+test_folder_path = os.path.dirname(__file__)
+configuration_file = os.path.join(test_folder_path, 'config.ini')
+
+
+def _product():
+    return SimpleNamespace(
+        mtl=SimpleNamespace(sun_zenith_angle=35.0, sun_azimuth_angle=150.0),
+        get_smac_filename=lambda band: 'Coef_S2A_CONT_B4.dat'
+    )
+
+
+class TestS2L_Atmcor(TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        if not config.initialize(configuration_file):
+            raise Exception
+
+    def test_smac_correction(self):
+        product = _product()
+        block = S2L_Atmcor(False)
+
+        array_in = np.linspace(-0.1, 1.0, 132, dtype=np.float32).reshape(11, 12)
+        result = block.smac_correction(product, array_in, 'B04')
+
+        # reference: scalar SMAC inversion + np.polyfit as done historically
+        smac_coefs = smac.coeff(get_smac_coefficients(product, 'B04'))
+        r_toa = np.arange(101) / 100.
+        r_surf = np.array([
+            smac.smac_inv(value, 35.0, 150.0, 0, 0, block.pressure, block.taup550, block.uO3, block.uH2O, smac_coefs)
+            for value in r_toa])
+        coefs = np.polyfit(r_toa, r_surf, 2)
+        expected = coefs[2] + coefs[1] * array_in + coefs[0] * array_in ** 2
+        expected[array_in <= 0] = 0
+
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+        # input must be left untouched
+        self.assertEqual(array_in[0, 0], np.float32(-0.1))
+
+        # float64 input is converted, the result is written in the converted copy
+        array_in_64 = array_in.astype(np.float64)
+        result_64 = block.smac_correction(product, array_in_64, 'B04')
+        self.assertEqual(result_64.dtype, np.float32)
+        np.testing.assert_allclose(result_64, result, rtol=1e-6)
+        self.assertEqual(array_in_64[0, 0], array_in[0, 0])
+
+    def test_smac_correction_threads(self):
+        product = _product()
+        array_in = np.linspace(-0.1, 1.0, 200 * 2000, dtype=np.float32).reshape(200, 2000)
+
+        block = S2L_Atmcor(False)
+        expected = block.smac_correction(product, array_in, 'B04')
+
+        # several threads and several row blocks per thread
+        block._number_of_threads = 3
+        result = block.smac_correction(product, array_in, 'B04')
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_project_batch(self):
+        # synthetic CAMS grid, 0.4 degree step as CAMS data.
+        # Fields are linear in lon / lat, so the tie point estimate must be exact
+        latitude = np.arange(90, -90.01, -0.4)
+        longitude = np.arange(0, 360, 0.4)
+        lon_grid, lat_grid = np.meshgrid(longitude, latitude)
+        cams_data = SimpleNamespace(latitude=latitude, longitude=longitude,
+                                    mandatory_attributes=['aod550', 'gtco3', 'msl', 'tcwv'],
+                                    aod550=0.01 * lon_grid + 0.02 * lat_grid + 1,
+                                    gtco3=-0.5 * lon_grid + 3 * lat_grid,
+                                    msl=0 * lon_grid + 2 * lat_grid + 1000,
+                                    tcwv=0 * lon_grid - lat_grid + 200)
+
+        lats = [43.3, 43.31, 42.1, -12.7]
+        lons = [1.2, 7.9, 180.1, -179.9]
+        atmo = ATMO_parameter(cams_data)
+        atmo.project_batch(lats, lons)
+
+        lats = np.array(lats)
+        lons = np.where(np.array(lons) > 0, lons, 360 + np.array(lons))
+        np.testing.assert_allclose(atmo.aod550, 0.01 * lons + 0.02 * lats + 1)
+        np.testing.assert_allclose(atmo.gtco3, -0.5 * lons + 3 * lats)
+        np.testing.assert_allclose(atmo.msl, 2 * lats + 1000)
+        np.testing.assert_allclose(atmo.tcwv, -lats + 200)
+
+        # single point, between 359.6 and 0 longitude (fields independent of longitude)
+        atmo.project(10.1, -0.2)
+        self.assertAlmostEqual(atmo.msl, 2 * 10.1 + 1000)
+        self.assertAlmostEqual(atmo.tcwv, -10.1 + 200)